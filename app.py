@@ -30,9 +30,9 @@ def main() -> None:
 
     # Step 3: Perform sentiment analysis on the candidates
     sentiment = SentimentAnalyzer()
-    sentiment_scores = sentiment.analyze_sentiment(ingestion.get_news_data())
+    news_data = ingestion.get_news_data()
     asset_sentiments = sentiment.aggregate_sentiment_by_asset(
-        ingestion.get_news_data(), candidate_assets
+        news_data, candidate_assets
     )
 
     # Step 4: Find top 5 interesting assets based on sentiment, volatility, and P/E
@@ -54,7 +54,6 @@ def main() -> None:
 
     # Step 5: Reinitialize DataIngestion with selected assets for detailed analysis
     ingestion = DataIngestion(assets=ASSETS)
-    detector = TradingSignalDetector(market_data=ingestion.get_market_data())
     EMAIL_CONFIG: Dict[str, str] = {
         "sender": os.getenv("EMAIL_SENDER", ""),
         "password": os.getenv("EMAIL_PASSWORD", ""),
@@ -64,10 +63,12 @@ def main() -> None:
     # Step 6: Fetch detailed data and run the full pipeline
     ingestion.fetch_market_data()
     ingestion.fetch_news_data()
-    sentiment_scores = sentiment.analyze_sentiment(ingestion.get_news_data())
-    asset_sentiments = sentiment.aggregate_sentiment_by_asset(
-        ingestion.get_news_data(), ASSETS
-    )
+    detector = TradingSignalDetector(market_data=ingestion.get_market_data())
+    news_data = ingestion.get_news_data()
+    # Score the news once; the aggregation reuses the same batch
+    batch = sentiment.analyze_sentiment_columnar(news_data)
+    sentiment_scores = dict(zip(batch.titles, batch.compound.tolist()))
+    asset_sentiments = sentiment.aggregate_sentiment_by_asset(news_data, ASSETS, batch)
     opportunities = detector.detect_opportunities()
     alerts.process_alerts(opportunities, asset_sentiments)
     logger.info("Alerts processed successfully")
@@ -1,54 +1,19 @@
 import smtplib
 import logging
 from email.mime.text import MIMEText
-from typing import Dict, List, Any
+from typing import Dict, List, Tuple
 import os
 from dotenv import load_dotenv
-import requests
+from jinja2 import Template
+from src.fmp_client import fetch_company_profiles
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-# FMP API key for fetching summaries
-FMP_API_KEY = os.getenv("FMP_API_KEY", "demo")
-
-
-def fetch_company_profile(ticker: str) -> Dict[str, Any]:
-    """Fetch company profile data from FMP API."""
-    try:
-        url = f"https://financialmodelingprep.com/api/v3/profile/{ticker}?apikey={FMP_API_KEY}"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        if not data or not isinstance(data, list) or len(data) == 0:
-            logger.warning(f"No profile data for {ticker}")
-            return {
-                "description": f"No data available for {ticker}",
-                "sector": "Unknown",
-                "sp500": "Unknown",
-            }
-
-        profile = data[0]
-        description = profile.get("description", "No description available")
-        sector = profile.get("sector", "Unknown")
-        industry = profile.get("industry", "")
-        full_sector = f"{sector} ({industry})" if industry else sector
-        market_cap = profile.get("mktCap", 0)
-        sp500_status = "Yes" if market_cap > 10_000_000_000 else "No"
-
-        return {
-            "description": description,
-            "sector": full_sector,
-            "sp500": sp500_status,
-        }
-    except requests.RequestException as e:
-        logger.error(f"Error fetching profile for {ticker}: {str(e)}")
-        return {
-            "description": f"Error fetching data for {ticker}",
-            "sector": "Unknown",
-            "sp500": "Unknown",
-        }
+# Compile the HTML email template once at import; autoescape keeps FMP text
+# (descriptions, sectors) from breaking the markup
+with open("src/email_template.html", "r") as file:
+    EMAIL_TEMPLATE = Template(file.read(), autoescape=True)
 
 
 class AlertManager:
@@ -79,6 +44,12 @@ class AlertManager:
 
     def send_email(self, subject: str, body: str) -> None:
         """Send an HTML email alert to the recipients."""
+        self.send_emails([(subject, body)])
+
+    def send_emails(self, messages: List[Tuple[str, str]]) -> None:
+        """Send several HTML email alerts over a single SMTP session."""
+        if not messages:
+            return
         if not self.sender or not self.password:
             logger.error("Cannot send email: Sender or password missing.")
             return
@@ -86,18 +57,25 @@ class AlertManager:
             logger.error("Cannot send email: No recipients specified.")
             return
 
-        # Create HTML email body
-        msg = MIMEText(body, "html")
-        msg["Subject"] = subject
-        msg["From"] = self.sender
-        msg["To"] = ", ".join(self.recipients)
-
         try:
+            # One connection + STARTTLS + login for the whole batch
             with smtplib.SMTP("smtp.gmail.com", 587) as server:
                 server.starttls()
                 server.login(self.sender, self.password)
-                server.sendmail(self.sender, self.recipients, msg.as_string())
-            logger.info(f"Email sent: {subject} to {self.recipients}")
+                for subject, body in messages:
+                    # Create HTML email body
+                    msg = MIMEText(body, "html")
+                    msg["Subject"] = subject
+                    msg["From"] = self.sender
+                    msg["To"] = ", ".join(self.recipients)
+                    # A rejected message must not drop the rest of the batch
+                    try:
+                        server.sendmail(self.sender, self.recipients, msg.as_string())
+                        logger.info(f"Email sent: {subject} to {self.recipients}")
+                    except smtplib.SMTPServerDisconnected:
+                        raise
+                    except smtplib.SMTPException as e:
+                        logger.error(f"Failed to send email '{subject}': {str(e)}")
         except smtplib.SMTPException as e:
             logger.error(f"Failed to send email: {str(e)}")
 
@@ -114,6 +92,7 @@ class AlertManager:
             asset_sentiments: Dict mapping assets to sentiment data.
         """
         logger.info("Processing alerts")
+        alertable = []
         for asset, signal in opportunities.items():
             sentiment_info = asset_sentiments.get(
                 asset, {"avg_compound": 0.0, "count": 0}
@@ -131,9 +110,14 @@ class AlertManager:
                     f"No alert for {asset}: Signal={signal}, Sentiment={avg_compound}"
                 )
                 continue
+            alertable.append((asset, signal, avg_compound, news_count))
 
-            # Fetch stock summary
-            profile = fetch_company_profile(asset)
+        # Fetch all stock summaries in one concurrent batch before formatting emails
+        profiles = fetch_company_profiles([asset for asset, *_ in alertable])
+
+        messages: List[Tuple[str, str]] = []
+        for asset, signal, avg_compound, news_count in alertable:
+            profile = profiles[asset]
 
             # Determine sentiment color for HTML
             sentiment_label = (
@@ -148,12 +132,8 @@ class AlertManager:
             )
             action_color = "green" if "Oversold" in signal else "red"
 
-            # Load the HTML template from file
-            with open("src/email_template.html", "r") as file:
-                template = file.read()
-
             # Construct HTML email content by replacing placeholders
-            body = template.format(
+            body = EMAIL_TEMPLATE.render(
                 action="Buy" if "Oversold" in signal else "Sell",
                 action_color=action_color,
                 asset=asset,
@@ -167,6 +147,8 @@ class AlertManager:
                 sp500=profile["sp500"],
             )
 
-            # Send the email
             subject = f"Trading Alert: {'Buy' if 'Oversold' in signal else 'Sell'} Opportunity for {asset}"
-            self.send_email(subject, body)
+            messages.append((subject, body))
+
+        # Send all emails over one SMTP session
+        self.send_emails(messages)
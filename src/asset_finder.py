@@ -1,15 +1,40 @@
 import yfinance as yf
 import pandas as pd
 import logging
-import requests
 import os
 from dotenv import load_dotenv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import numpy as np
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import attrgetter
+from src import disk_cache
+from src.data_ingestion import download_history
+from src.fmp_client import fetch_quotes
+from src.http_client import SESSION
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Losers list is served from disk while fresher than LOSERS_TTL; between that and
+# LOSERS_MAX_STALE it is still served but refreshed in the background
+LOSERS_TTL = 300  # 5 minutes
+LOSERS_MAX_STALE = 3600  # 1 hour
+
+
+@dataclass(slots=True)
+class AssetScore:
+    """Metrics and combined score for one candidate stock."""
+
+    ticker: str
+    market_cap: float
+    volatility: float
+    pe_ratio: float
+    score: float = 0.0
+    sentiment: float = 0.0
+    news_count: int = 0
+
 
 class AssetFinder:
     def __init__(self, target_assets: int = 5, max_candidates: int = 10) -> None:
@@ -26,17 +51,30 @@ class AssetFinder:
         if not self.fmp_api_key:
             logger.error("FMP_API_KEY not found in .env file")
             raise ValueError("FMP_API_KEY is required")
-        self.stock_candidates = self.fetch_biggest_losers()
+        self.stock_candidates = self.load_biggest_losers()
         logger.info(
             f"Initialized AssetFinder with {len(self.stock_candidates)} stock candidates"
         )
 
+    def load_biggest_losers(self) -> List[str]:
+        """Return the cached losers list, only waiting on FMP when none is usable."""
+        cached = disk_cache.load("fmp_losers", str(self.max_candidates))
+        if cached is None or cached[1] >= LOSERS_MAX_STALE:
+            return self.fetch_biggest_losers()
+
+        tickers, age = cached
+        if age >= LOSERS_TTL:
+            # Stale-while-revalidate: serve the cached list, refresh it for next time
+            logger.info(f"Serving {age:.0f}s old losers list, refreshing in background")
+            threading.Thread(target=self.fetch_biggest_losers, daemon=True).start()
+        return tickers
+
     def fetch_biggest_losers(self) -> List[str]:
         """Fetch stocks with the biggest losses today using FinancialModelingPrep API."""
         try:
             # FMP endpoint for stock market losers
             url = f"https://financialmodelingprep.com/api/v3/stock_market/losers?limit={self.max_candidates}&apikey={self.fmp_api_key}"
-            response = requests.get(url)
+            response = SESSION.get(url, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -56,6 +94,7 @@ class AssetFinder:
                     "HESM",
                 ]
             logger.info(f"Fetched {len(tickers)} biggest losers: {tickers}")
+            disk_cache.store("fmp_losers", str(self.max_candidates), tickers)
             return tickers
         except Exception as e:
             logger.error(f"Error fetching biggest losers from FMP: {str(e)}")
@@ -73,38 +112,40 @@ class AssetFinder:
                 "HESM",
             ]
 
-    def calculate_volatility(self, history: pd.DataFrame) -> float:
-        """Calculate the volatility (standard deviation of daily returns)."""
-        if len(history) < 2:
-            return 0.0
-        returns = history["Close"].pct_change().dropna()
-        return returns.std() * np.sqrt(252)  # Annualized volatility
+    def calculate_volatilities(self, closes: pd.DataFrame) -> pd.Series:
+        """
+        Calculate annualized volatility (standard deviation of daily returns) per ticker.
 
-    def fetch_asset_data(self, ticker: str) -> Dict[str, Any]:
-        """Fetch market data for a single stock and calculate metrics."""
+        Args:
+            closes: Wide close-price frame with one column per ticker.
+        """
+        # Divide by each ticker's previous valid close so gaps don't drop a return
+        returns = closes / closes.ffill().shift() - 1
+        volatility = returns.std() * np.sqrt(252)  # Annualized volatility
+        return volatility.fillna(0.0)  # Fewer than two returns: no measurable spread
+
+    def fetch_asset_data(
+        self, ticker: str, volatility: float, quote: Dict[str, Any]
+    ) -> Optional[AssetScore]:
+        """Build metrics for a single stock from its FMP quote and precomputed volatility."""
         try:
-            asset = yf.Ticker(ticker)
-            history = asset.history(period="14d", interval="1d")
-            if history.empty:
-                return None
-
-            # Market Cap and P/E Ratio
-            info = asset.info
-            market_cap = info.get("marketCap", 0)
-            pe_ratio = info.get(
-                "forwardPE", float("inf")
-            )  # Use forward P/E; default to inf if unavailable
+            # Market Cap and P/E Ratio from the batched quote; fall back to Yahoo's
+            # lightweight fast_info for market cap only when FMP has none
+            market_cap = quote.get("marketCap") or 0
+            if not market_cap:
+                market_cap = yf.Ticker(ticker).fast_info.get("marketCap") or 0
+            pe_ratio = quote.get("pe")
+            if pe_ratio is None:
+                pe_ratio = float("inf")  # Default to inf if unavailable
             if market_cap == 0:
                 return None
 
-            volatility = self.calculate_volatility(history)
-
-            return {
-                "ticker": ticker,
-                "market_cap": market_cap,
-                "volatility": volatility,
-                "pe_ratio": pe_ratio,
-            }
+            return AssetScore(
+                ticker=ticker,
+                market_cap=market_cap,
+                volatility=volatility,
+                pe_ratio=pe_ratio,
+            )
         except Exception as e:
             logger.error(f"Error fetching data for {ticker}: {str(e)}")
             return None
@@ -118,16 +159,39 @@ class AssetFinder:
         Args:
             asset_sentiments: Sentiment data from SentimentAnalyzer {ticker: {"avg_compound": float, "count": int}}
         """
-        asset_data = []
+        asset_data: List[AssetScore] = []
+        if not self.stock_candidates:
+            logger.warning("No stock candidates to evaluate")
+            return []
+
+        # One batched download gives every candidate's closes; volatility is one pass
+        daily_all = download_history(self.stock_candidates, period="14d", interval="1d")
+        if daily_all.empty:
+            logger.warning("No price history for stock candidates")
+            return []
+        closes = daily_all.xs("Close", level=1, axis=1).dropna(how="all", axis=1)
+        volatilities = self.calculate_volatilities(closes)
+        tickers = [ticker for ticker in self.stock_candidates if ticker in volatilities]
+        quotes = fetch_quotes(tickers)  # One FMP call for every candidate
+
+        # Only the fast_info fallback touches the network; fan it out across threads
+        with ThreadPoolExecutor(max_workers=min(16, len(tickers) or 1)) as executor:
+            fetched = list(
+                executor.map(
+                    self.fetch_asset_data,
+                    tickers,
+                    [volatilities[ticker] for ticker in tickers],
+                    [quotes.get(ticker, {}) for ticker in tickers],
+                )
+            )
 
-        for ticker in self.stock_candidates:
-            data = self.fetch_asset_data(ticker)
+        for data in fetched:
             if not data:
                 continue
 
             # Get sentiment score
             sentiment_info = asset_sentiments.get(
-                ticker, {"avg_compound": 0.0, "count": 0}
+                data.ticker, {"avg_compound": 0.0, "count": 0}
             )
             sentiment_score = abs(
                 sentiment_info["avg_compound"]
@@ -138,24 +202,23 @@ class AssetFinder:
 
             # P/E ratio score (lower is better for undervaluation; invert for scoring)
             pe_score = (
-                1 / data["pe_ratio"]
-                if data["pe_ratio"] != float("inf") and data["pe_ratio"] > 0
+                1 / data.pe_ratio
+                if data.pe_ratio != float("inf") and data.pe_ratio > 0
                 else 0.0
             )
 
             # Calculate combined score (weights: sentiment 40%, volatility 30%, P/E 30%)
-            score = sentiment_weight * 0.4 + data["volatility"] * 0.3 + pe_score * 0.3
-            data["score"] = score
-            data["sentiment"] = sentiment_score
-            data["news_count"] = sentiment_info["count"]
+            data.score = sentiment_weight * 0.4 + data.volatility * 0.3 + pe_score * 0.3
+            data.sentiment = sentiment_score
+            data.news_count = sentiment_info["count"]
             asset_data.append(data)
 
         # Sort by score and return top assets
-        asset_data.sort(key=lambda x: x["score"], reverse=True)
-        selected_assets = [data["ticker"] for data in asset_data[: self.target_assets]]
+        asset_data.sort(key=attrgetter("score"), reverse=True)
+        selected_assets = [data.ticker for data in asset_data[: self.target_assets]]
 
         logger.info(f"Found interesting stocks: {selected_assets}")
         logger.debug(
-            f"Asset scores: {[f'{d["ticker"]}: score={d["score"]:.2f}, sentiment={d["sentiment"]:.2f}, volatility={d["volatility"]:.2f}, pe_ratio={d["pe_ratio"]:.2f}' for d in asset_data[: self.target_assets]]}"
+            f"Asset scores: {[f'{d.ticker}: score={d.score:.2f}, sentiment={d.sentiment:.2f}, volatility={d.volatility:.2f}, pe_ratio={d.pe_ratio:.2f}' for d in asset_data[: self.target_assets]]}"
         )
         return selected_assets
@@ -1,11 +1,11 @@
 import streamlit as st
 import logging
 import pandas as pd
-import plotly.express as px
-import requests
+import plotly.graph_objects as go
 import os
 from dotenv import load_dotenv
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+from src import fmp_client
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -20,52 +20,29 @@ def load_css(file_path: str) -> str:
 # Load CSS from the external file
 LIGHT_MODE_CSS = load_css("src/styles.css")
 
+# Price chart with the fixed styling baked in; cards only fill in data and y-range
+PRICE_CHART_TEMPLATE = go.Figure(
+    go.Scatter(mode="lines", line=dict(color="#00cc96")),
+    layout=dict(
+        height=150,
+        margin=dict(l=0, r=0, t=0, b=0),
+        yaxis=dict(title=""),
+        xaxis=dict(title="", tickformat="%b %d"),
+        showlegend=False,
+    ),
+)
+
 # FMP API key
-FMP_API_KEY = os.getenv("FMP_API_KEY")
-if not FMP_API_KEY:
+if not os.getenv("FMP_API_KEY"):
     logger.error("FMP_API_KEY not found in .env file")
     st.error("FMP API key is missing. Please add it to your .env file.")
-    FMP_API_KEY = "demo"  # FMP demo key for testing (limited)
 
 
-# Cached function to fetch company profile from FMP
+# Cached function to fetch all dashboard profiles from FMP in one concurrent batch
 @st.cache_data(ttl=86400)  # Cache for 24 hours (86,400 seconds)
-def fetch_company_profile(ticker: str) -> Dict[str, Any]:
-    """Fetch company profile data from FMP API with caching."""
-    try:
-        url = f"https://financialmodelingprep.com/api/v3/profile/{ticker}?apikey={FMP_API_KEY}"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        if not data or not isinstance(data, list) or len(data) == 0:
-            logger.warning(f"No profile data for {ticker}")
-            return {
-                "description": f"No data available for {ticker}",
-                "sector": "Unknown",
-                "sp500": "Unknown",
-            }
-
-        profile = data[0]
-        description = profile.get("description", "No description available")
-        sector = profile.get("sector", "Unknown")
-        industry = profile.get("industry", "")
-        full_sector = f"{sector} ({industry})" if industry else sector
-        market_cap = profile.get("mktCap", 0)
-        sp500_status = "Yes" if market_cap > 10_000_000_000 else "No"  # Rough heuristic
-
-        return {
-            "description": description,
-            "sector": full_sector,
-            "sp500": sp500_status,
-        }
-    except Exception as e:
-        logger.error(f"Error fetching profile for {ticker}: {str(e)}")
-        return {
-            "description": f"Error fetching data for {ticker}",
-            "sector": "Unknown",
-            "sp500": "Unknown",
-        }
+def fetch_company_profiles(tickers: Tuple[str, ...]) -> Dict[str, Dict[str, Any]]:
+    """Fetch company profiles for several tickers with caching."""
+    return fmp_client.fetch_company_profiles(list(tickers))
 
 
 def run_dashboard(ingestion: Any, sentiment: Any, detector: Any, alerts: Any) -> None:
@@ -83,11 +60,25 @@ def run_dashboard(ingestion: Any, sentiment: Any, detector: Any, alerts: Any) ->
     # Fetch data
     market_data = ingestion.get_market_data()
     news_data = ingestion.get_news_data()
-    sentiment_scores = sentiment.analyze_sentiment(news_data)
+    # Score the news once; the aggregation reuses the same batch
+    batch = sentiment.analyze_sentiment_columnar(news_data)
+    sentiment_scores = dict(zip(batch.titles, batch.compound.tolist()))
     asset_sentiments = sentiment.aggregate_sentiment_by_asset(
-        news_data, ingestion.assets
+        news_data, ingestion.assets, batch
     )
-    opportunities = detector.detect_opportunities()
+    # Detect signals on the same snapshot the cards render
+    opportunities = detector.detect_opportunities(market_data)
+    profiles = fetch_company_profiles(tuple(ingestion.assets))
+
+    # Index news by asset in one pass, lowercasing each news item once; as in
+    # aggregate_sentiment_by_asset, tickers never span the newline joiner
+    asset_lower = list(zip(ingestion.assets, ingestion.assets_lower))
+    news_by_asset: Dict[str, List[str]] = {asset: [] for asset in ingestion.assets}
+    for title, info in news_data.items():
+        haystack = f"{title}\n{info['description']}".lower()
+        for asset, al in asset_lower:
+            if al in haystack:
+                news_by_asset[asset].append(title)
 
     # Asset Cards
     for asset in ingestion.assets:
@@ -108,25 +99,19 @@ def run_dashboard(ingestion: Any, sentiment: Any, detector: Any, alerts: Any) ->
 
                     # Price Chart using Plotly
                     daily_history = market_data[asset]["daily_history"]
-                    if daily_history:
-                        df = pd.DataFrame({"Price": daily_history})
+                    if len(daily_history):
                         dates = pd.date_range(
                             start=pd.Timestamp.now()
                             - pd.Timedelta(days=len(daily_history) - 1),
                             periods=len(daily_history),
                             freq="D",
                         )
-                        df["Date"] = dates
-                        min_price = min(daily_history) * 0.95  # 5% buffer below
-                        max_price = max(daily_history) * 1.05  # 5% buffer above
-                        fig = px.line(df, x="Date", y="Price", height=150)
-                        fig.update_traces(line_color="#00cc96")
-                        fig.update_layout(
-                            margin=dict(l=0, r=0, t=0, b=0),
-                            yaxis=dict(range=[min_price, max_price], title=""),
-                            xaxis=dict(title="", tickformat="%b %d"),
-                            showlegend=False,
-                        )
+                        min_price = daily_history.min() * 0.95  # 5% buffer below
+                        max_price = daily_history.max() * 1.05  # 5% buffer above
+                        fig = go.Figure(PRICE_CHART_TEMPLATE)
+                        fig.data[0].x = dates
+                        fig.data[0].y = daily_history
+                        fig.layout.yaxis.range = [min_price, max_price]
                         st.plotly_chart(fig, use_container_width=True)
                     else:
                         st.warning(f"No market data for {asset}")
@@ -172,28 +157,24 @@ def run_dashboard(ingestion: Any, sentiment: Any, detector: Any, alerts: Any) ->
             # News Section
             with st.expander("📰 Latest News"):
                 if news_count > 0:
-                    for title, info in news_data.items():
-                        if (
-                            asset.lower() in title.lower()
-                            or asset.lower() in info["description"].lower()
-                        ):
-                            score = sentiment_scores.get(title, {}).get("compound", 0.0)
-                            sentiment_color = (
-                                ":green"
-                                if score > 0.05
-                                else ":red"
-                                if score < -0.05
-                                else ":gray"
-                            )
-                            st.markdown(
-                                f"- {sentiment_color}[{title}] (Score: {score:.2f})",
-                                unsafe_allow_html=True,
-                            )
+                    for title in news_by_asset[asset]:
+                        score = sentiment_scores.get(title, 0.0)
+                        sentiment_color = (
+                            ":green"
+                            if score > 0.05
+                            else ":red"
+                            if score < -0.05
+                            else ":gray"
+                        )
+                        st.markdown(
+                            f"- {sentiment_color}[{title}] (Score: {score:.2f})",
+                            unsafe_allow_html=True,
+                        )
                 else:
                     st.info("No recent news available.")
 
             # Stock Summary Section (Dynamic from FMP)
-            profile = fetch_company_profile(asset)
+            profile = profiles[asset]
             st.markdown('<div class="card">', unsafe_allow_html=True)
             st.markdown(f"**📋 Summary**: {profile['description']}")
             st.markdown(f"**🏭 Sector**: {profile['sector']}")
@@ -1,31 +1,71 @@
 import yfinance as yf
+import pandas as pd
+import numpy as np
 import feedparser
 from apscheduler.schedulers.background import BackgroundScheduler
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 import logging
-from typing import Dict, List, Any
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
+from src.http_client import SESSION
 
 logger = logging.getLogger(__name__)
 
 
+def download_history(assets: List[str], period: str, interval: str) -> pd.DataFrame:
+    """Download price history for all assets in a single batched yfinance call."""
+    return yf.download(
+        list(assets),
+        period=period,
+        interval=interval,
+        group_by="ticker",
+        auto_adjust=True,
+        threads=True,
+        progress=False,
+    )
+
+
+def asset_history(history: pd.DataFrame, asset: str) -> pd.DataFrame:
+    """Slice one asset out of a batched download, dropping rows it has no data for."""
+    if isinstance(history.columns, pd.MultiIndex):
+        if asset not in history.columns.get_level_values(0):
+            return pd.DataFrame()
+        history = history[asset]
+    return history.dropna(how="all")
+
+
 class DataIngestion:
     def __init__(self, assets: List[str]) -> None:
-        self.assets = assets
-        self.scheduler = BackgroundScheduler()
+        # Tickers are hot dict keys everywhere downstream; intern them and keep a
+        # lowercase copy for case-insensitive news matching
+        self.assets = tuple(sys.intern(asset) for asset in assets)
+        self.assets_lower = tuple(asset.lower() for asset in self.assets)
+        # Both jobs spend their time in batched/concurrent I/O, so two scheduler
+        # threads are enough; coalesce missed runs instead of stacking them up
+        self.scheduler = BackgroundScheduler(
+            executors={"default": {"type": "threadpool", "max_workers": 2}},
+            job_defaults={"coalesce": True, "max_instances": 1},
+        )
         self.market_data: Dict[str, Dict[str, Any]] = {}
         self.news_data: Dict[str, Dict[str, str]] = {}
         self.last_market_fetch: Dict[str, datetime] = {}
+        # Read-only snapshots handed to callers; replaced wholesale after each refresh
+        # so readers never see a dict mid-update from the scheduler thread
+        self._market_snapshot: Mapping[str, Dict[str, Any]] = MappingProxyType({})
+        self._news_snapshot: Mapping[str, Dict[str, str]] = MappingProxyType({})
         logger.info(f"Initialized DataIngestion with assets: {self.assets}")
 
     def fetch_market_data(self) -> None:
         try:
+            # Two batched downloads cover every asset instead of two calls per asset
+            intraday_all = download_history(self.assets, period="1d", interval="5m")
+            daily_all = download_history(self.assets, period="14d", interval="1d")
             for asset in self.assets:
-                ticker = yf.Ticker(asset)
                 now = datetime.now()
-                last_fetch = self.last_market_fetch.get(asset, now - timedelta(days=1))
-
-                intraday = ticker.history(period="1d", interval="5m")
-                daily = ticker.history(period="14d", interval="1d")
+                intraday = asset_history(intraday_all, asset)
+                daily = asset_history(daily_all, asset)
 
                 if not intraday.empty and not daily.empty:
                     latest_intraday = intraday.iloc[-1]
@@ -34,7 +74,7 @@ class DataIngestion:
                         "volume": int(latest_intraday["Volume"]),
                         "timestamp": now.isoformat(),
                         "intraday_history": intraday["Close"].tolist(),
-                        "daily_history": daily["Close"].tolist(),
+                        "daily_history": daily["Close"].to_numpy(dtype=np.float32),
                     }
                     self.last_market_fetch[asset] = now
                     logger.info(
@@ -42,22 +82,42 @@ class DataIngestion:
                     )
                 else:
                     logger.warning(f"No market data for {asset}")
+            self._market_snapshot = MappingProxyType(dict(self.market_data))
         except Exception as e:
             logger.error(f"Error fetching market data: {str(e)}")
 
+    def fetch_news_feed(self, asset: str) -> List[Any]:
+        """Download and parse the Yahoo Finance RSS feed for a single asset."""
+        url_asset = asset.replace("-USD", "")  # e.g., BTC-USD -> BTCUSD
+        url = f"https://finance.yahoo.com/rss/headline?s={url_asset}"
+        logger.debug(f"Fetching news from RSS: {url}")
+        try:
+            response = SESSION.get(
+                url, headers={"User-Agent": feedparser.USER_AGENT}, timeout=10
+            )
+            response.raise_for_status()
+            feed = feedparser.parse(response.content)
+            return feed.entries[:5]  # Top 5 news items
+        except Exception as e:
+            logger.error(f"Error fetching news for {asset}: {str(e)}")
+            return []
+
     def fetch_news_data(self) -> None:
         """Fetch latest news for assets from Yahoo Finance RSS."""
         try:
-            self.news_data.clear()
-            for asset in self.assets:
-                url_asset = asset.replace("-USD", "")  # e.g., BTC-USD -> BTCUSD
-                url = f"https://finance.yahoo.com/rss/headline?s={url_asset}"
-                logger.debug(f"Fetching news from RSS: {url}")
-                feed = feedparser.parse(url)
-                entries = feed.entries[:5]  # Top 5 news items
+            if not self.assets:
+                self.news_data = {}
+                self._news_snapshot = MappingProxyType({})
+                return
+            # Download all feeds concurrently; map keeps results in asset order
+            with ThreadPoolExecutor(max_workers=min(16, len(self.assets))) as executor:
+                feeds = list(executor.map(self.fetch_news_feed, self.assets))
+
+            news_data: Dict[str, Dict[str, str]] = {}
+            for asset, entries in zip(self.assets, feeds):
                 for entry in entries:
                     title = entry.title
-                    self.news_data[title] = {
+                    news_data[title] = {
                         "description": entry.summary,
                         "source": "Yahoo Finance",
                         "published_at": (
@@ -69,6 +129,8 @@ class DataIngestion:
                 logger.info(
                     f"Fetched {len(entries)} news items for {asset} from Yahoo Finance RSS"
                 )
+            self.news_data = news_data
+            self._news_snapshot = MappingProxyType(news_data)
         except Exception as e:
             logger.error(f"Error fetching news data: {str(e)}")
 
@@ -81,11 +143,11 @@ class DataIngestion:
         except Exception as e:
             logger.error(f"Error starting scheduler: {str(e)}")
 
-    def get_market_data(self) -> Dict[str, Dict[str, Any]]:
-        return self.market_data
+    def get_market_data(self) -> Mapping[str, Dict[str, Any]]:
+        return self._market_snapshot
 
-    def get_news_data(self) -> Dict[str, Dict[str, str]]:
-        return self.news_data
+    def get_news_data(self) -> Mapping[str, Dict[str, str]]:
+        return self._news_snapshot
 
     def stop_scheduler(self) -> None:
         self.scheduler.shutdown()
@@ -0,0 +1,71 @@
+import functools
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Callable, Optional, Tuple
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+# Root directory for on-disk caches shared by every process of the app
+CACHE_DIR = os.getenv("SCRAPPY_CACHE_DIR", ".cache")
+
+
+def _entry_path(namespace: str, key: str) -> str:
+    return os.path.join(CACHE_DIR, namespace, f"{quote(key, safe='')}.json")
+
+
+def load(namespace: str, key: str) -> Optional[Tuple[Any, float]]:
+    """Return (value, age in seconds) for a cached entry, or None if it is missing."""
+    try:
+        with open(_entry_path(namespace, key), "r") as file:
+            entry = json.load(file)
+        return entry["value"], time.time() - entry["stored_at"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def store(namespace: str, key: str, value: Any) -> None:
+    """Persist a JSON-serializable value; the write is atomic so readers never see partial files."""
+    path = _entry_path(namespace, key)
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # A fresh temp file per call: concurrent writers, whether processes or
+        # Streamlit session threads, never share one before it is swapped in
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            json.dump({"stored_at": time.time(), "value": value}, file)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Could not write cache entry {namespace}/{key}: {str(e)}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def cached(namespace: str, ttl: int) -> Callable:
+    """
+    Cache a function of a single string key on disk for `ttl` seconds.
+
+    Results of None are not cached, so failed lookups are retried on the next call.
+    """
+
+    def decorator(func: Callable[[str], Any]) -> Callable[[str], Any]:
+        @functools.wraps(func)
+        def wrapper(key: str) -> Any:
+            hit = load(namespace, key)
+            if hit is not None and hit[1] < ttl:
+                return hit[0]
+            value = func(key)
+            if value is not None:
+                store(namespace, key, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,93 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from dotenv import load_dotenv
+from src.disk_cache import cached
+from src.http_client import SESSION
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# FMP API key for fetching summaries
+FMP_API_KEY = os.getenv("FMP_API_KEY", "demo")
+
+# Concurrent profile requests; kept modest to stay friendly with FMP rate limits
+MAX_PROFILE_WORKERS = 8
+
+
+@cached("fmp_profiles", ttl=86400)  # Profiles barely change intraday; keep for 24 hours
+def _request_company_profile(ticker: str) -> Optional[Dict[str, Any]]:
+    """Request a company profile from FMP, returning None when FMP has no data."""
+    url = f"https://financialmodelingprep.com/api/v3/profile/{ticker}?apikey={FMP_API_KEY}"
+    response = SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+
+    if not data or not isinstance(data, list) or len(data) == 0:
+        return None
+
+    profile = data[0]
+    description = profile.get("description", "No description available")
+    sector = profile.get("sector", "Unknown")
+    industry = profile.get("industry", "")
+    full_sector = f"{sector} ({industry})" if industry else sector
+    market_cap = profile.get("mktCap", 0)
+    sp500_status = "Yes" if market_cap > 10_000_000_000 else "No"  # Rough heuristic
+
+    return {
+        "description": description,
+        "sector": full_sector,
+        "sp500": sp500_status,
+    }
+
+
+def fetch_company_profile(ticker: str) -> Dict[str, Any]:
+    """Fetch company profile data from FMP API, backed by a shared on-disk cache."""
+    try:
+        profile = _request_company_profile(ticker)
+        if profile is None:
+            logger.warning(f"No profile data for {ticker}")
+            return {
+                "description": f"No data available for {ticker}",
+                "sector": "Unknown",
+                "sp500": "Unknown",
+            }
+        return profile
+    except Exception as e:
+        logger.error(f"Error fetching profile for {ticker}: {str(e)}")
+        return {
+            "description": f"Error fetching data for {ticker}",
+            "sector": "Unknown",
+            "sp500": "Unknown",
+        }
+
+
+def fetch_company_profiles(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch company profiles for several tickers concurrently."""
+    if not tickers:
+        return {}
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_PROFILE_WORKERS, len(tickers))
+    ) as executor:
+        return dict(zip(tickers, executor.map(fetch_company_profile, tickers)))
+
+
+def fetch_quotes(tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch FMP quotes (price, market cap, P/E, ...) for several tickers in one request."""
+    if not tickers:
+        return {}
+    try:
+        symbols = ",".join(tickers)
+        url = f"https://financialmodelingprep.com/api/v3/quote/{symbols}?apikey={FMP_API_KEY}"
+        response = SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+
+        if not isinstance(data, list):
+            logger.warning(f"Unexpected quote response for {symbols}")
+            return {}
+        return {quote["symbol"]: quote for quote in data if "symbol" in quote}
+    except Exception as e:
+        logger.error(f"Error fetching quotes for {tickers}: {str(e)}")
+        return {}
@@ -0,0 +1,21 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session for outbound HTTP (FMP, Yahoo RSS). Reusing one pooled session
+# keeps connections alive between calls instead of paying a fresh TCP + TLS
+# handshake per request, and is safe to share across worker threads.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # Retry rate limits and transient server errors with exponential backoff
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
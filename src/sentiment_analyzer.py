@@ -1,35 +1,172 @@
 import logging
-import re
-from typing import Dict, List
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+import numpy as np
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 import nltk
 
-# Download VADER lexicon if not already present
-try:
-    nltk.data.find("vader_lexicon")
-except LookupError:
-    nltk.download("vader_lexicon")
-
 logger = logging.getLogger(__name__)
 
+# Every byte preprocess_text deletes: anything but ASCII letters, digits and space
+_NON_ALNUM_BYTES = bytes(
+    c for c in range(256) if not (chr(c).isascii() and (chr(c).isalnum() or c == 32))
+)
+
+
+def _strip_urls(text: str) -> str:
+    """
+    Cut each word from its first "http"/"www" on, as the regex http\\S+|www\\S+ would.
+
+    Args:
+        text: Words separated by single spaces
+
+    Returns:
+        The text with URL tails removed (may leave repeated spaces)
+    """
+    kept = []
+    copied = search = 0
+    while True:
+        hits = [
+            i for i in (text.find("http", search), text.find("www", search)) if i != -1
+        ]
+        if not hits:
+            break
+        start = min(hits)
+        end = start + (4 if text[start] == "h" else 3)
+        # A bare marker at the end of a word is not a URL: it needs one more character
+        if end < len(text) and text[end] != " ":
+            kept.append(text[copied:start])
+            copied = text.find(" ", end)
+            if copied == -1:
+                copied = len(text)
+            search = copied
+        else:
+            search = start + 1
+    kept.append(text[copied:])
+    return "".join(kept)
+
+
+@lru_cache(maxsize=1)
+def _get_vader() -> SentimentIntensityAnalyzer:
+    """Shared VADER analyzer for this process; the lexicon is loaded only once."""
+    try:
+        return SentimentIntensityAnalyzer()
+    except LookupError:
+        # Download VADER lexicon only when it is actually missing
+        nltk.download("vader_lexicon")
+        return SentimentIntensityAnalyzer()
+
+
+# What VADER returns for text with nothing left to score after cleaning
+_ZERO_SCORES: Mapping[str, float] = MappingProxyType(
+    {"neg": 0.0, "neu": 0.0, "pos": 0.0, "compound": 0.0}
+)
+
+# Number of distinct texts whose cleaned form / scores are remembered. The caches
+# are per process: headlines recur across refreshes and across feeds
+SCORE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=SCORE_CACHE_SIZE)
+def _polarity_scores(
+    analyzer: SentimentIntensityAnalyzer, cleaned_text: str
+) -> Mapping[str, float]:
+    """VADER scores for already-cleaned text, cached and wrapped read-only."""
+    return MappingProxyType(analyzer.polarity_scores(cleaned_text))
+
+
+# Below this many texts, starting worker processes (each loading the VADER
+# lexicon) costs more than scoring serially; a refresh is a few dozen headlines
+PARALLEL_SCORING_THRESHOLD = 2000
+
+
+def _score_worker(cleaned_text: str) -> Optional[Dict[str, float]]:
+    """Score cleaned text inside a pool worker, loading VADER once per process."""
+    try:
+        return _get_vader().polarity_scores(cleaned_text)
+    except Exception as e:
+        logger.warning(f"Skipping sentiment for '{cleaned_text}': {str(e)}")
+        return None
+
+
+def news_texts(news_data: Dict[str, Dict[str, str]]) -> List[str]:
+    """Combine each news item's title and description into the text that gets scored."""
+    return [f"{title} {info['description']}" for title, info in news_data.items()]
+
+
+@dataclass(slots=True)
+class SentimentBatch:
+    """VADER scores as one array per score; row i belongs to titles[i]."""
+
+    titles: List[str]
+    neg: np.ndarray
+    neu: np.ndarray
+    pos: np.ndarray
+    compound: np.ndarray
+
 
 class SentimentAnalyzer:
     def __init__(self) -> None:
         """Initialize the SentimentAnalyzer with VADER."""
-        self.analyzer = SentimentIntensityAnalyzer()
+        self.analyzer = _get_vader()
         logger.info("Initialized SentimentAnalyzer with VADER")
 
-    def preprocess_text(self, text: str) -> str:
-        """Clean text for sentiment analysis."""
-        # Remove URLs, special characters, and extra whitespace
-        text = re.sub(r"http\S+|www\S+|https\S+", "", text, flags=re.MULTILINE)
-        text = re.sub(r"[^A-Za-z0-9\s]", "", text)
+    @staticmethod
+    @lru_cache(maxsize=SCORE_CACHE_SIZE)
+    def preprocess_text(text: str) -> str:
+        """Clean text for sentiment analysis (cached per process)."""
+        # Normalise whitespace first: non-ASCII spaces still separate words
         text = " ".join(text.split())
-        return text.lower()
+        # Remove URLs, then special characters, and collapse the gaps they leave
+        if "http" in text or "www" in text:
+            text = _strip_urls(text)
+        data = text.encode("ascii", "ignore").translate(None, _NON_ALNUM_BYTES)
+        return " ".join(data.lower().decode("ascii").split())
+
+    def _score_text(self, text: str) -> Mapping[str, float]:
+        """Return VADER scores for a text, reusing results for repeated texts."""
+        cleaned = self.preprocess_text(text)
+        if not cleaned:
+            return _ZERO_SCORES
+        return _polarity_scores(self.analyzer, cleaned)
+
+    def _score_texts(self, texts: List[str]) -> List[Optional[Mapping[str, float]]]:
+        """
+        Score texts in order, fanning very large batches out to worker processes.
+
+        Args:
+            texts: Texts to score, e.g. from news_texts(news_data)
+
+        Returns:
+            Scores aligned with texts; None for a text that failed to score, so one
+            bad entry is skipped instead of aborting the rest
+        """
+        if len(texts) < PARALLEL_SCORING_THRESHOLD:
+            # Bind the scorer once, outside the loop; each text has its own try
+            score_text = self._score_text
+            scored: List[Optional[Mapping[str, float]]] = []
+            for text in texts:
+                try:
+                    scored.append(score_text(text))
+                except Exception as e:
+                    logger.warning(f"Skipping sentiment for '{text}': {str(e)}")
+                    scored.append(None)
+            return scored
+        cleaned = [self.preprocess_text(text) for text in texts]
+        # Only texts with something left to score are shipped to the workers
+        with ProcessPoolExecutor() as executor:
+            scored = iter(
+                executor.map(_score_worker, filter(None, cleaned), chunksize=64)
+            )
+            return [next(scored) if text else _ZERO_SCORES for text in cleaned]
 
     def analyze_sentiment(
         self, news_data: Dict[str, Dict[str, str]]
-    ) -> Dict[str, Dict[str, float]]:
+    ) -> Dict[str, Mapping[str, float]]:
         """
         Analyze sentiment of news data.
 
@@ -37,25 +174,51 @@ class SentimentAnalyzer:
             news_data: {title: {"description": str, "source": str, "published_at": str}}
 
         Returns:
-            {title: {"neg": float, "neu": float, "pos": float, "compound": float}}
+            {title: {"neg": float, "neu": float, "pos": float, "compound": float}},
+            with each score mapping read-only (shared with the score cache)
         """
         sentiment_scores = {}
+        all_scores = self._score_texts(news_texts(news_data))
+        for title, scores in zip(news_data, all_scores):
+            if scores is None:  # Failed to score; already logged
+                continue
+            # VADER already returns exactly neg/neu/pos/compound; keep its result
+            sentiment_scores[title] = scores
+            logger.debug("Sentiment for '%s': %s", title, scores)
+        logger.info("Sentiment analysis completed for all news items")
+        return sentiment_scores
+
+    def _score_columns(self, news_data: Dict[str, Dict[str, str]]) -> SentimentBatch:
+        """Score news_data into a SentimentBatch; items that failed to score read 0."""
+        texts = news_texts(news_data)
+        all_scores = [scores or _ZERO_SCORES for scores in self._score_texts(texts)]
+        columns = {
+            key: np.fromiter(
+                (scores[key] for scores in all_scores), np.float64, len(all_scores)
+            )
+            for key in ("neg", "neu", "pos", "compound")
+        }
+        return SentimentBatch(titles=list(news_data), **columns)
+
+    def analyze_sentiment_columnar(
+        self, news_data: Dict[str, Dict[str, str]]
+    ) -> SentimentBatch:
+        """
+        Analyze sentiment of news data into column arrays instead of per-title dicts.
+
+        Args:
+            news_data: News data from DataIngestion
+
+        Returns:
+            SentimentBatch aligned with news_data's titles (all zeros on error)
+        """
         try:
-            for title, info in news_data.items():
-                text = f"{title} {info['description']}"  # Combine title and description
-                cleaned_text = self.preprocess_text(text)
-                scores = self.analyzer.polarity_scores(cleaned_text)
-                sentiment_scores[title] = {
-                    "neg": scores["neg"],
-                    "neu": scores["neu"],
-                    "pos": scores["pos"],
-                    "compound": scores["compound"],
-                }
-                logger.debug(f"Sentiment for '{title}': {scores}")
-            logger.info("Sentiment analysis completed for all news items")
+            batch = self._score_columns(news_data)
+            logger.info(f"Sentiment analysis completed for {len(batch.titles)} items")
+            return batch
         except Exception as e:
-            logger.error(f"Error in sentiment analysis: {str(e)}")
-        return sentiment_scores
+            logger.error(f"Error in columnar sentiment analysis: {str(e)}")
+            return SentimentBatch(list(news_data), *np.zeros((4, len(news_data))))
 
     def classify_sentiment(self, compound_score: float) -> str:
         """Classify sentiment based on compound score."""
@@ -67,7 +230,10 @@ class SentimentAnalyzer:
             return "neutral"
 
     def aggregate_sentiment_by_asset(
-        self, news_data: Dict[str, Dict[str, str]], assets: List[str]
+        self,
+        news_data: Dict[str, Dict[str, str]],
+        assets: List[str],
+        batch: Optional[SentimentBatch] = None,
     ) -> Dict[str, Dict[str, float]]:
         """
         Aggregate sentiment scores by asset.
@@ -75,32 +241,39 @@ class SentimentAnalyzer:
         Args:
             news_data: News data from DataIngestion
             assets: List of assets to analyze
+            batch: Scores already computed for news_data by analyze_sentiment_columnar;
+                news_data is scored here when omitted
 
         Returns:
             {asset: {"avg_compound": float, "count": int}}
         """
-        sentiment_scores = self.analyze_sentiment(news_data)
-        asset_sentiments: Dict[str, List[float]] = {asset: [] for asset in assets}
+        assets = [sys.intern(asset) for asset in assets]
 
         try:
-            for title, scores in sentiment_scores.items():
-                # Check which asset(s) the news relates to
-                for asset in assets:
-                    if (
-                        asset.lower() in title.lower()
-                        or asset.lower() in news_data[title]["description"].lower()
-                    ):
-                        asset_sentiments[asset].append(scores["compound"])
+            if batch is None:
+                batch = self._score_columns(news_data)
+            compound = batch.compound
+            # Lowercase each item once; tickers never contain the newline joiner,
+            # so one scan of the haystack equals checking title and description
+            haystacks = [
+                f"{title}\n{info['description']}".lower()
+                for title, info in news_data.items()
+            ]
 
             aggregated = {}
-            for asset, compounds in asset_sentiments.items():
-                if compounds:
-                    aggregated[asset] = {
-                        "avg_compound": sum(compounds) / len(compounds),
-                        "count": len(compounds),
-                    }
-                else:
-                    aggregated[asset] = {"avg_compound": 0.0, "count": 0}
+            for asset in assets:
+                # Boolean mask of the news items that mention this asset
+                asset_lower = asset.lower()
+                mentions = np.fromiter(
+                    (asset_lower in haystack for haystack in haystacks),
+                    bool,
+                    len(haystacks),
+                )
+                count = int(mentions.sum())
+                aggregated[asset] = {
+                    "avg_compound": float(compound[mentions].mean()) if count else 0.0,
+                    "count": count,
+                }
                 logger.info(f"Aggregated sentiment for {asset}: {aggregated[asset]}")
             return aggregated
         except Exception as e:
@@ -1,45 +1,167 @@
 import logging
+from typing import Mapping
 import pandas as pd
 import numpy as np  # Use numpy.nan instead of NaN
 
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; the kernels then run as plain Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
 logger = logging.getLogger(__name__)
 
+# RSI only feeds 70/30 thresholds, so single precision is plenty and halves the
+# memory traffic of the smoothing passes; daily_history is already stored as float32
+RSI_DTYPE = np.float32
+
+# Wilder's lookback; one RSI needs RSI_PERIOD price changes (RSI_PERIOD + 1 closes)
+RSI_PERIOD = 14
+
+
+@njit(cache=True)
+def _wilder(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder smoothing (EWM with alpha=1/period); NaN until `period` values are seen."""
+    smoothed = np.empty_like(values)
+    smoothed[0] = values[0]
+    for i in range(1, values.shape[0]):
+        smoothed[i] = (smoothed[i - 1] * (period - 1) + values[i]) / period
+    smoothed[: period - 1] = np.nan
+    return smoothed
+
+
+def _smooth(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder smoothing via the numba kernel, or pandas' C-level ewm without numba."""
+    if HAVE_NUMBA:
+        return _wilder(values, period)
+    # Same recursion as _wilder (seeded with the first value), one pass in C
+    return (
+        pd.Series(values)
+        .ewm(alpha=1 / period, adjust=False, min_periods=period)
+        .mean()
+        .to_numpy()
+    )
 
-def calculate_rsi(series: pd.Series, period: int = 14) -> pd.Series:
-    """Calculate RSI manually using pandas and numpy."""
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
 
-    avg_gain = gain.rolling(window=period, min_periods=1).mean()
-    avg_loss = loss.rolling(window=period, min_periods=1).mean()
+def calculate_rsi(series: pd.Series, period: int = RSI_PERIOD) -> pd.Series:
+    """Calculate RSI with Wilder's smoothing (numba, or pandas ewm without it)."""
+    closes = series.to_numpy(dtype=RSI_DTYPE)
+    if len(closes) < 2:
+        return pd.Series(np.nan, index=series.index)
+    delta = np.diff(closes)
+    gain = np.where(delta > 0, delta, RSI_DTYPE(0.0))
+    loss = np.where(delta < 0, -delta, RSI_DTYPE(0.0))
 
-    rs = avg_gain / avg_loss.replace(0, np.nan)  # Avoid division by zero
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    avg_gain = _smooth(gain, period)
+    avg_loss = _smooth(loss, period)
+
+    # RSI = 100 - 100 / (1 + gain/loss) = 100 * gain / (gain + loss), written straight
+    # into the result: 100 with gains but no losses, NaN for flat closes (no moves
+    # at all); the first close has no change, so it keeps NaN
+    total = avg_gain + avg_loss
+    rsi = np.full(len(closes), np.nan, dtype=RSI_DTYPE)
+    np.divide(avg_gain, total, out=rsi[1:], where=total > 0)
+    rsi *= 100.0
+    return pd.Series(rsi, index=series.index)
+
+
+@njit(cache=True)
+def _last_rsi_1d(closes: np.ndarray, period: int) -> float:
+    """Latest Wilder RSI of one close-price array; NaN with fewer than period + 1 closes."""
+    if closes.shape[0] < period + 1:
+        return np.nan
+    # One pass with running averages: no delta/gain/loss/smoothed arrays are built
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, closes.shape[0]):
+        delta = closes[i] - closes[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i == 1:  # The first change seeds the averages, as in _wilder
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+    total = avg_gain + avg_loss
+    if total == 0:  # Flat closes: no signal either way
+        return np.nan
+    return 100.0 * avg_gain / total  # 100 when there were gains but no losses
+
+
+@njit(cache=True, parallel=True)
+def _last_rsi_batch(
+    closes2d: np.ndarray, lengths: np.ndarray, period: int, out: np.ndarray
+) -> None:
+    """Fill out[i] with the latest RSI of row i's first lengths[i] closes, in parallel."""
+    for i in prange(closes2d.shape[0]):
+        out[i] = _last_rsi_1d(closes2d[i, : lengths[i]], period)
 
 
 class TradingSignalDetector:
-    def __init__(self, market_data: dict[str, dict]) -> None:
+    def __init__(self, market_data: Mapping[str, dict]) -> None:
+        """
+        Initialize the detector with a market data snapshot.
+
+        Args:
+            market_data: Read-only snapshot from DataIngestion.get_market_data(). It is
+                frozen at construction and does not follow later scheduler refreshes;
+                pass a newer snapshot to detect_opportunities instead.
+        """
         self.market_data = market_data
 
-    def detect_opportunities(self) -> dict[str, str]:
+    def detect_opportunities(
+        self, market_data: Mapping[str, dict] | None = None
+    ) -> dict[str, str]:
+        """
+        Label each asset with its RSI signal.
+
+        Args:
+            market_data: Snapshot to analyze; defaults to the one given at init
+        """
         logger.info("Detecting trading opportunities with manual RSI")
+        if market_data is None:
+            market_data = self.market_data
         opportunities = {}
-        for asset, data in self.market_data.items():
-            if "daily_history" in data and len(data["daily_history"]) >= 14:
-                df = pd.DataFrame(data["daily_history"], columns=["Close"])
-                rsi_series = calculate_rsi(df["Close"], period=14)
-                rsi = rsi_series.iloc[-1]
-                if pd.notna(rsi):
-                    if rsi > 70:
-                        opportunities[asset] = "Momentum (Overbought)"
-                    elif rsi < 30:
-                        opportunities[asset] = "Momentum (Oversold)"
-                    else:
-                        opportunities[asset] = "No signal"
-                else:
-                    opportunities[asset] = "No signal (insufficient data)"
-            else:
-                opportunities[asset] = "No signal (insufficient history)"
+        histories = {
+            asset: data["daily_history"]
+            for asset, data in market_data.items()
+            if "daily_history" in data and len(data["daily_history"]) >= RSI_PERIOD + 1
+        }
+
+        # Pad every history into one 2D array so all RSIs come from a single kernel
+        rsi_by_asset: dict[str, str] = {}
+        if histories:
+            lengths = np.array([len(h) for h in histories.values()], dtype=np.int64)
+            closes2d = np.full((len(histories), lengths.max()), np.nan, dtype=RSI_DTYPE)
+            for row, history in enumerate(histories.values()):
+                closes2d[row, : len(history)] = history
+            rsi_all = np.empty(len(histories), dtype=RSI_DTYPE)
+            _last_rsi_batch(closes2d, lengths, RSI_PERIOD, rsi_all)
+
+            # Label every asset at once; the first matching condition wins
+            labels = np.select(
+                [~np.isfinite(rsi_all), rsi_all > 70, rsi_all < 30],
+                [
+                    "No signal (insufficient data)",
+                    "Momentum (Overbought)",
+                    "Momentum (Oversold)",
+                ],
+                default="No signal",
+            )
+            rsi_by_asset = dict(zip(histories, labels.tolist()))
+
+        for asset in market_data:
+            opportunities[asset] = rsi_by_asset.get(
+                asset, "No signal (insufficient history)"
+            )
         return opportunities